@@ -0,0 +1,93 @@
+"""
+Shared Configuration
+
+Settings used by both main.py and the examples. The .env file is loaded and
+the environment is read once, when this module is first imported.
+
+Usage:
+    from config import CONFIG
+    print(CONFIG.app_name)
+"""
+
+import os
+import re
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+
+
+# Names of the shared variables, kept in one place. (sys.intern isn't needed
+# for speed here: Python already interns short name-like string literals.)
+_K_APP = sys.intern('APP_NAME')
+_K_ENV = sys.intern('PYTHON_ENV')
+_K_DEBUG = sys.intern('DEBUG')
+
+# Values that count as "true" for on/off settings like DEBUG=true
+_TRUE_VALUES = frozenset({'1', 'true', 'yes', 'on', 't', 'y'})
+
+# Matches whitespace and quotes at the start or end of a value
+_STRIP_RE = re.compile(r'^[\s"\']+|[\s"\']+$')
+
+# The project's .env file, found next to this file no matter where you run from
+ENV_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.env')
+
+
+def load_env_file(path=ENV_FILE):
+    """Load simple KEY=VALUE lines from a .env file (a tiny python-dotenv)"""
+    # Relative paths like '.env.development' are looked up in the project folder.
+    # 'export KEY=value' lines are accepted (the 'export' is ignored). Unlike
+    # python-dotenv, this doesn't support inline '# comments' after unquoted
+    # values, multi-line values or ${VAR} expansion.
+    path = os.path.join(os.path.dirname(ENV_FILE), path)
+    try:
+        file = open(path, 'r', encoding='utf-8')
+    except OSError:
+        return False
+
+    with file:
+        for line in file:
+            line = line.strip()
+            # Skip empty lines and comments
+            if not line or line[0] == '#':
+                continue
+            # Allow shell-style lines like: export APP_NAME=MyApp
+            if line.startswith('export '):
+                line = line[len('export '):]
+            key, sep, value = line.partition('=')
+            key = key.strip()
+            # Skip lines without '=' or without a name (like '=oops')
+            if sep and key:
+                # Like load_dotenv(), don't overwrite variables that are already set
+                os.environ.setdefault(key, _STRIP_RE.sub('', value))
+    return True
+
+
+@lru_cache(maxsize=1)
+def load_env_once():
+    """Load the .env file only the first time this is called"""
+    return load_env_file()
+
+
+def env_bool(key, default=False):
+    """Read an environment variable as True/False"""
+    value = os.environ.get(key)
+    if value is None:
+        return default
+    return value.lower() in _TRUE_VALUES
+
+
+@dataclass(frozen=True)
+class AppConfig:
+    """Application settings read from environment variables"""
+    app_name: str
+    python_env: str
+    debug: bool
+
+
+# Load .env first so its values are included, then read the settings once
+load_env_once()
+CONFIG = AppConfig(
+    app_name=os.environ.get(_K_APP, 'PythonDockerApp'),
+    python_env=os.environ.get(_K_ENV, 'development'),
+    debug=env_bool(_K_DEBUG),
+)
@@ -43,11 +43,18 @@ def basic_types_example():
     # None type
     empty_value = None
     
-    print(f"Integer: {integer_number} (type: {type(integer_number).__name__})")
-    print(f"Float: {float_number} (type: {type(float_number).__name__})")
-    print(f"String: {single_quoted} {double_quoted} (type: {type(single_quoted).__name__})")
-    print(f"Boolean: {is_true}, {is_false} (type: {type(is_true).__name__})")
-    print(f"None: {empty_value} (type: {type(empty_value).__name__})")
+    # Look up each type name once and reuse it
+    int_type = type(integer_number).__name__
+    float_type = type(float_number).__name__
+    str_type = type(single_quoted).__name__
+    bool_type = type(is_true).__name__
+    none_type = type(empty_value).__name__
+    
+    print(f"Integer: {integer_number} (type: {int_type})")
+    print(f"Float: {float_number} (type: {float_type})")
+    print(f"String: {single_quoted} {double_quoted} (type: {str_type})")
+    print(f"Boolean: {is_true}, {is_false} (type: {bool_type})")
+    print(f"None: {empty_value} (type: {none_type})")
 
 
 def string_operations_example():
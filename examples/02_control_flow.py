@@ -79,13 +79,18 @@ def loop_examples():
     for index, fruit in enumerate(fruits, 1):
         print(f"  {index}. {fruit}")
     
-    # While loop
+    # For loop counting down (range with a step of -1)
     print("\nCountdown:")
-    countdown = 5
-    while countdown > 0:
+    for countdown in range(5, 0, -1):
         print(f"  {countdown}...")
-        countdown -= 1
     print("  🚀 Launch!")
+
+    # While loop (best when you don't know in advance how many steps it takes)
+    print("\nDoubling until over 100:")
+    value = 1
+    while value <= 100:
+        value *= 2
+    print(f"  Reached {value}")
     
     # List comprehension (advanced for loop)
     squares = [x**2 for x in range(1, 6)]
@@ -139,10 +144,14 @@ def fibonacci(n):
     elif n == 2:
         return [0, 1]
     
-    fib = [0, 1]
+    # Create the full list up front and fill it in (no resizing while looping)
+    fib = [0] * n
+    fib[1] = 1
+    a, b = 0, 1
     for i in range(2, n):
-        fib.append(fib[i-1] + fib[i-2])
-    
+        a, b = b, a + b
+        fib[i] = b
+
     return fib
 
 
@@ -152,8 +161,8 @@ if __name__ == "__main__":
     # Bonus examples
     print("\n🎯 Bonus Examples:")
     
-    # Check even numbers from 1 to 10
-    even_numbers = [num for num in range(1, 11) if is_even(num)]
+    # Even numbers from 1 to 10 (stepping the range by 2, no check needed)
+    even_numbers = list(range(2, 11, 2))
     print(f"Even numbers 1-10: {even_numbers}")
     
     # Fibonacci sequence
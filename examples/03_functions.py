@@ -7,6 +7,23 @@ Learn about creating and using functions, and organizing code into modules.
 To run: make run FILE=examples/03_functions.py
 """
 
+import time
+from functools import lru_cache
+
+# Numba is optional: it compiles numeric functions to fast machine code.
+# If it's not installed, njit becomes a decorator that does nothing.
+try:
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
 def main():
     print("🔧 Functions and Modules Examples")
     print("=" * 35)
@@ -55,10 +72,8 @@ def advanced_function_examples():
     
     # Function with **kwargs (keyword arguments)
     def create_profile(**kwargs):
-        profile = {}
-        for key, value in kwargs.items():
-            profile[key] = value
-        return profile
+        # kwargs is already a dictionary, so just make a copy of it
+        return dict(kwargs)
     
     # Function with both *args and **kwargs
     def flexible_function(*args, **kwargs):
@@ -81,10 +96,14 @@ def advanced_function_examples():
     print(f"Lambda square of 5: {square(5)}")
     print(f"Lambda multiply 3*4: {multiply(3, 4)}")
     
-    # Higher-order functions
+    # Higher-order functions: map() and filter() call a function for every item
     numbers = [1, 2, 3, 4, 5]
-    squared_numbers = list(map(square, numbers))
-    even_numbers = list(filter(lambda x: x % 2 == 0, numbers))
+    print(f"Map with lambda: {list(map(square, numbers))}")
+    print(f"Filter with lambda: {list(filter(lambda x: x % 2 == 0, numbers))}")
+    
+    # List comprehensions do the same job without the extra function calls
+    squared_numbers = [n * n for n in numbers]
+    even_numbers = [n for n in numbers if not n & 1]
     
     print(f"Original: {numbers}")
     print(f"Squared: {squared_numbers}")
@@ -123,12 +142,12 @@ def module_examples():
 # Decorator examples
 def timer_decorator(func):
     """A simple decorator to time function execution"""
-    import time
     
     def wrapper(*args, **kwargs):
-        start_time = time.time()
+        # perf_counter is the most precise clock for measuring durations
+        start_time = time.perf_counter()
         result = func(*args, **kwargs)
-        end_time = time.time()
+        end_time = time.perf_counter()
         print(f"Function {func.__name__} took {end_time - start_time:.4f} seconds")
         return result
     
@@ -138,20 +157,40 @@ def timer_decorator(func):
 @timer_decorator
 def slow_function():
     """A function that takes some time to execute"""
-    import time
     time.sleep(0.1)  # Sleep for 0.1 seconds
     return "Function completed!"
 
 
-# Recursion example
+# Compiled loop examples (fast with numba, plain Python without it)
+# cache=True saves the compiled code to disk so later runs skip compiling.
+# numba uses 64-bit integers, which can't hold factorial(21) or fibonacci_iter(93),
+# so with numba larger inputs raise an error instead of giving a wrong answer.
+# Plain Python integers have no size limit, so without numba any n works.
+@njit(cache=True)
 def factorial(n):
-    """Calculate factorial using recursion"""
-    if n <= 1:
-        return 1
-    else:
-        return n * factorial(n - 1)
+    """Calculate factorial using a loop"""
+    if _HAVE_NUMBA and n > 20:
+        raise ValueError("factorial() only supports n <= 20")
+    p = 1
+    for i in range(2, n + 1):
+        p *= i
+    return p
+
+
+@njit(cache=True)
+def fibonacci_iter(n):
+    """Calculate nth fibonacci number using a loop"""
+    if _HAVE_NUMBA and n > 92:
+        raise ValueError("fibonacci_iter() only supports n <= 92")
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
 
 
+# Recursion example
+# lru_cache remembers previous results, so each value is only computed once
+@lru_cache(maxsize=None)
 def fibonacci_recursive(n):
     """Calculate nth fibonacci number using recursion"""
     if n <= 1:
@@ -170,9 +209,14 @@ if __name__ == "__main__":
     result = slow_function()
     print(f"Slow function result: {result}")
     
-    # Recursion examples
+    # Loop and recursion examples
     print(f"Factorial of 5: {factorial(5)}")
+    print(f"10th Fibonacci number (loop): {fibonacci_iter(10)}")
     print(f"5th Fibonacci number: {fibonacci_recursive(5)}")
+    print(f"35th Fibonacci number: {fibonacci_recursive(35)}")  # Instant thanks to caching
+    
+    # Clear the cache so repeated runs start fresh
+    fibonacci_recursive.cache_clear()
     
     # Scope example
     global_var = "I'm global"
@@ -9,6 +9,23 @@ To run: make run FILE=examples/04_file_handling.py
 
 import os
 import json
+from pathlib import Path
+
+# orjson is an optional, much faster JSON library. Fall back to the built-in json module.
+try:
+    import orjson
+
+    def dumps_json(data):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+    def loads_json(data):
+        return orjson.loads(data)
+except ImportError:
+    def dumps_json(data):
+        return json.dumps(data, indent=2).encode("utf-8")
+
+    def loads_json(data):
+        return json.loads(data)
 
 
 def main():
@@ -35,20 +52,26 @@ def create_example_files():
     """Create example files for demonstration"""
     print("\n📝 Creating example files...")
     
-    # Create a simple text file
+    # Create a simple text file (writelines writes a whole list in one call)
+    lines = [
+        "Hello, Python!\n",
+        "This is a sample text file.\n",
+        "It contains multiple lines.\n",
+        "Perfect for learning file operations!\n",
+    ]
     with open("sample.txt", "w") as file:
-        file.write("Hello, Python!\n")
-        file.write("This is a sample text file.\n")
-        file.write("It contains multiple lines.\n")
-        file.write("Perfect for learning file operations!\n")
+        file.writelines(lines)
     
     # Create a CSV-like file
+    rows = [
+        "name,age,grade\n",
+        "Alice,20,A\n",
+        "Bob,19,B\n",
+        "Charlie,21,A\n",
+        "Diana,20,C\n",
+    ]
     with open("students.csv", "w") as file:
-        file.write("name,age,grade\n")
-        file.write("Alice,20,A\n")
-        file.write("Bob,19,B\n")
-        file.write("Charlie,21,A\n")
-        file.write("Diana,20,C\n")
+        file.writelines(rows)
     
     print("✅ Example files created!")
 
@@ -57,19 +80,16 @@ def text_file_examples():
     """Examples of text file operations"""
     print("\n📄 Text File Operations:")
     
-    # Reading entire file
+    # Reading entire file (Path opens, reads and closes the file for you)
     print("Reading entire file:")
-    with open("sample.txt", "r") as file:
-        content = file.read()
-        print(content)
+    content = Path("sample.txt").read_text()
+    print(content)
     
     # Reading line by line
     print("Reading line by line:")
     with open("sample.txt", "r") as file:
-        line_number = 1
-        for line in file:
+        for line_number, line in enumerate(file, 1):
             print(f"  Line {line_number}: {line.strip()}")
-            line_number += 1
     
     # Reading all lines into a list
     with open("sample.txt", "r") as file:
@@ -78,14 +98,11 @@ def text_file_examples():
     
     # Writing to a file
     print("\nWriting to a new file:")
-    with open("output.txt", "w") as file:
-        file.write("This is a new file!\n")
-        file.write("Created by Python script.\n")
-        
-        # Writing a list of items
-        items = ["apple", "banana", "cherry"]
-        for item in items:
-            file.write(f"- {item}\n")
+    items = ["apple", "banana", "cherry"]
+    lines = ["This is a new file!\n", "Created by Python script.\n"]
+    # Add a line for each item in the list
+    lines += [f"- {item}\n" for item in items]
+    Path("output.txt").write_text("".join(lines))
     
     # Appending to a file
     with open("output.txt", "a") as file:
@@ -93,8 +110,7 @@ def text_file_examples():
     
     # Reading the created file
     print("Content of the new file:")
-    with open("output.txt", "r") as file:
-        print(file.read())
+    print(Path("output.txt").read_text())
 
 
 def json_file_examples():
@@ -115,15 +131,23 @@ def json_file_examples():
         "graduation_year": None
     }
     
-    # Writing JSON to file
-    with open("student.json", "w") as file:
-        json.dump(student_data, file, indent=2)
+    # Writing JSON to file (as bytes, which is what orjson produces)
+    with open("student.json", "wb") as file:
+        file.write(dumps_json(student_data))
     
     print("JSON data written to file!")
     
+    # Writing compact JSON (no indentation or extra spaces)
+    with open("student_compact.json", "w") as file:
+        json.dump(student_data, file, separators=(',', ':'))
+    
+    pretty_size = os.path.getsize("student.json")
+    compact_size = os.path.getsize("student_compact.json")
+    print(f"Compact JSON written: {compact_size} bytes vs {pretty_size} bytes pretty-printed")
+    print("💡 Compact JSON is smaller and faster to write (indent uses a slower encoder)")
+    
     # Reading JSON from file
-    with open("student.json", "r") as file:
-        loaded_data = json.load(file)
+    loaded_data = loads_json(Path("student.json").read_bytes())
     
     print("Loaded JSON data:")
     print(f"Name: {loaded_data['name']}")
@@ -140,22 +164,26 @@ def file_system_examples():
     """Examples of file system operations"""
     print("\n🗂️ File System Operations:")
     
+    # Read the current directory once. Each entry knows its name (and whether it's
+    # a file or folder); entry.stat() still asks the system for size and dates.
+    with os.scandir(".") as directory:
+        entries = {entry.name: entry for entry in directory}
+    
     # Check if file exists
     files_to_check = ["sample.txt", "nonexistent.txt", "student.json"]
     for filename in files_to_check:
-        if os.path.exists(filename):
+        if filename in entries:
             print(f"✅ {filename} exists")
             # Get file size
-            size = os.path.getsize(filename)
+            size = entries[filename].stat().st_size
             print(f"   Size: {size} bytes")
         else:
             print(f"❌ {filename} does not exist")
     
     # List files in current directory
     print(f"\nFiles in current directory:")
-    files = os.listdir(".")
-    python_files = [f for f in files if f.endswith('.py')]
-    other_files = [f for f in files if not f.endswith('.py')]
+    python_files = [name for name in entries if name.endswith('.py')]
+    other_files = [name for name in entries if not name.endswith('.py')]
     
     print("Python files:")
     for file in python_files:
@@ -181,7 +209,7 @@ def cleanup_files():
     """Clean up example files"""
     print("\n🧹 Cleaning up example files...")
     
-    files_to_remove = ["sample.txt", "students.csv", "output.txt", "student.json"]
+    files_to_remove = ["sample.txt", "students.csv", "output.txt", "student.json", "student_compact.json"]
     
     for filename in files_to_remove:
         try:
@@ -220,7 +248,7 @@ if __name__ == "__main__":
     error_handling_examples()
     
     print("\n🎯 File Handling Tips:")
-    print("1. Always use 'with' statement for file operations")
+    print("1. Always use 'with' statement for file operations (or pathlib's read_text/write_text)")
     print("2. Handle exceptions when working with files")
     print("3. Use appropriate file modes: 'r' (read), 'w' (write), 'a' (append)")
     print("4. Use JSON for structured data storage")
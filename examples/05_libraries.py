@@ -61,14 +61,25 @@ def requests_examples():
     try:
         import requests
         
+        # orjson is an optional, faster JSON parser
+        try:
+            import orjson
+        except ImportError:
+            orjson = None
+        
         # Simple GET request to a public API
         print("Making a GET request to JSONPlaceholder API...")
         
         try:
-            response = requests.get("https://jsonplaceholder.typicode.com/posts/1")
+            # A Session reuses the same connection for every request it makes
+            with requests.Session() as session:
+                response = session.get("https://jsonplaceholder.typicode.com/posts/1", timeout=5)
             
             if response.status_code == 200:
-                data = response.json()
+                if orjson is not None:
+                    data = orjson.loads(response.content)
+                else:
+                    data = response.json()
                 print(f"✅ Request successful!")
                 print(f"Post title: {data['title']}")
                 print(f"Post body: {data['body'][:50]}...")
@@ -99,12 +110,16 @@ def numpy_examples():
         # Array operations
         print(f"Array sum: {np.sum(array1)}")
         print(f"Array mean: {np.mean(array1)}")
-        print(f"Array squared: {array1 ** 2}")
+        
+        # Square in place (out=) since the original values aren't needed anymore
+        np.square(array1, out=array1)
+        print(f"Array squared: {array1}")
         
         # Creating special arrays
         zeros = np.zeros(5)
         ones = np.ones((2, 3))
-        random_array = np.random.random(5)
+        rng = np.random.default_rng()  # Recommended random number generator
+        random_array = rng.random(5)
         
         print(f"Zeros array: {zeros}")
         print(f"Ones array:\n{ones}")
@@ -112,7 +127,10 @@ def numpy_examples():
         
         # Mathematical operations
         x = np.linspace(0, 10, 5)  # 5 points between 0 and 10
-        y = np.sin(x)
+        y = np.empty_like(x)
+        # Write the result into an existing array instead of creating a new one
+        # (on large arrays this avoids allocating a whole extra array)
+        np.sin(x, out=y)
         
         print(f"X values: {x}")
         print(f"Sin(X) values: {y}")
@@ -153,8 +171,8 @@ def pandas_examples():
         print(f"Max salary: ${df['Salary'].max():,.2f}")
         print(f"Min salary: ${df['Salary'].min():,.2f}")
         
-        # Filtering data
-        high_earners = df[df['Salary'] > 75000]
+        # Filtering data (query uses numexpr for speed on big tables, if installed)
+        high_earners = df.query("Salary > 75000")
         print(f"\nHigh earners (>$75,000):")
         print(high_earners[['Name', 'Salary']])
         
@@ -163,7 +181,8 @@ def pandas_examples():
         
         # Creating a simple time series
         dates = pd.date_range('2024-01-01', periods=5, freq='D')
-        ts = pd.Series(np.random.randint(1, 100, 5), index=dates)
+        rng = np.random.default_rng()
+        ts = pd.Series(rng.integers(1, 100, 5), index=dates)
         
         print(f"\nTime series:")
         print(ts)
@@ -183,12 +202,14 @@ def matplotlib_examples():
         import numpy as np
         
         # Create sample data
+        rng = np.random.default_rng()
         x = np.linspace(0, 10, 100)
         y1 = np.sin(x)
         y2 = np.cos(x)
         
         # Create a simple plot
-        plt.figure(figsize=(10, 6))
+        # constrained_layout arranges the subplots once when the figure is drawn
+        plt.figure(figsize=(10, 6), constrained_layout=True)
         
         # Subplot 1: Line plot
         plt.subplot(2, 2, 1)
@@ -211,7 +232,7 @@ def matplotlib_examples():
         
         # Subplot 3: Histogram
         plt.subplot(2, 2, 3)
-        data = np.random.normal(0, 1, 1000)
+        data = rng.normal(0, 1, 1000)
         plt.hist(data, bins=30, color='orange', alpha=0.7)
         plt.title('Normal Distribution')
         plt.xlabel('Value')
@@ -219,16 +240,15 @@ def matplotlib_examples():
         
         # Subplot 4: Scatter plot
         plt.subplot(2, 2, 4)
-        x_scatter = np.random.randn(50)
-        y_scatter = x_scatter + np.random.randn(50) * 0.5
+        x_scatter = rng.standard_normal(50)
+        y_scatter = x_scatter + rng.standard_normal(50) * 0.5
         plt.scatter(x_scatter, y_scatter, color='purple', alpha=0.6)
         plt.title('Scatter Plot')
         plt.xlabel('X values')
         plt.ylabel('Y values')
         
-        # Adjust layout and save
-        plt.tight_layout()
-        plt.savefig('sample_plots.png', dpi=300, bbox_inches='tight')
+        # Save the figure (dpi=100 is plenty for screens; 300 makes a 9x larger image)
+        plt.savefig('sample_plots.png', dpi=100, bbox_inches='tight')
         plt.close()
         
         print("✅ Plots created and saved as 'sample_plots.png'")
@@ -246,6 +266,13 @@ def beautifulsoup_examples():
     
     try:
         from bs4 import BeautifulSoup
+        import importlib.util
+        
+        # Use the fast C-based lxml parser if installed, otherwise the built-in one
+        if importlib.util.find_spec('lxml') is not None:
+            parser = 'lxml'
+        else:
+            parser = 'html.parser'
         
         # Example with local HTML (safer for containers)
         html_content = """
@@ -265,8 +292,9 @@ def beautifulsoup_examples():
         </html>
         """
         
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, parser)
         
+        print(f"Parser: {parser}")
         print(f"Page title: {soup.title.text}")
         print(f"Main heading: {soup.h1.text}")
         
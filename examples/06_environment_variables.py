@@ -10,7 +10,41 @@ First, create a .env file: make env-setup
 """
 
 import os
-from dotenv import load_dotenv
+import sys
+from functools import cached_property, lru_cache
+
+# Importing config loads the .env file and reads the shared settings once.
+# config.py lives in the project folder, which PYTHONPATH=/app makes importable.
+try:
+    from config import CONFIG, env_bool, load_env_once
+except ImportError:
+    # PYTHONPATH isn't set (e.g. running outside the container), so add the project folder
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from config import CONFIG, env_bool, load_env_once
+
+
+# Variables shown, checked and required by the examples below
+_ENV_VARS = ('PYTHONPATH', 'PYTHON_ENV', 'APP_NAME', 'DEBUG', 'PATH')
+_SENSITIVE_VARS = ('SECRET_KEY', 'API_KEY', 'DATABASE_URL')
+_REQUIRED_PROD_VARS = ('SECRET_KEY', 'DATABASE_URL')
+
+# Template/default values that should be replaced before going to production
+_DEFAULT_VALUES = frozenset({'dev-secret-key', 'your-secret-key-here', 'sqlite:///app.db'})
+
+# Log level and cache timeout (seconds) for each environment
+_ENV_SETTINGS = {
+    'development': ('DEBUG', 0),     # No caching in dev
+    'staging': ('INFO', 300),        # 5 minutes
+    'production': ('WARNING', 3600), # 1 hour
+}
+
+
+# Parses each integer variable once and remembers the result.
+# Changes made to os.environ later in the program won't be seen by it.
+@lru_cache(maxsize=None)
+def env_int(key, default):
+    """Read an environment variable as an integer (cached)"""
+    return int(os.environ.get(key, default))
 
 
 def main():
@@ -35,7 +69,7 @@ def load_env_examples():
     print("\n📂 Loading Environment Variables:")
     
     # Load .env file (if it exists)
-    env_loaded = load_dotenv()
+    env_loaded = load_env_once()
     
     if env_loaded:
         print("✅ .env file loaded successfully!")
@@ -44,17 +78,24 @@ def load_env_examples():
         print("💡 Run 'make env-setup' to create a .env template")
     
     # You can also load from specific files
-    # load_dotenv('.env.development')
-    # load_dotenv('.env.production')
+    # load_env_file('.env.development')  (from config.py)
+    # load_env_file('.env.production')
+    # (load_env_file only reads simple KEY=VALUE lines; python-dotenv's
+    #  load_dotenv() also handles inline comments, multi-line values, etc.)
     
     print("\n📋 Available environment variables:")
-    env_vars = ['PYTHONPATH', 'PYTHON_ENV', 'APP_NAME', 'DEBUG', 'PATH']
-    for var in env_vars:
-        value = os.getenv(var, 'Not set')
-        # Hide sensitive info in PATH
-        if var == 'PATH':
-            value = f"{value[:50]}..." if len(value) > 50 else value
-        print(f"  {var}: {value}")
+    lines = [f"  {var}: {_display_value(var)}\n" for var in _ENV_VARS]
+    # Write all lines at once
+    sys.stdout.writelines(lines)
+
+
+def _display_value(var):
+    """Get an environment variable's value, shortened for display"""
+    value = os.environ.get(var, 'Not set')
+    # Hide sensitive info in PATH
+    if var == 'PATH' and len(value) > 50:
+        value = value[:50] + "..."
+    return value
 
 
 def basic_env_examples():
@@ -62,22 +103,24 @@ def basic_env_examples():
     print("\n🔧 Basic Environment Variable Operations:")
     
     # Getting environment variables
-    app_name = os.getenv('APP_NAME', 'DefaultApp')
-    debug_mode = os.getenv('DEBUG', 'false').lower() == 'true'
-    python_env = os.getenv('PYTHON_ENV', 'development')
+    # The most common settings come from the shared config (see config.py)
+    app_name = CONFIG.app_name
+    debug_mode = CONFIG.debug
+    python_env = CONFIG.python_env
     
     print(f"App Name: {app_name}")
     print(f"Debug Mode: {debug_mode}")
     print(f"Python Environment: {python_env}")
     
-    # Setting environment variables (runtime only)
-    os.environ['TEMP_VAR'] = 'temporary_value'
-    print(f"Temporary Variable: {os.getenv('TEMP_VAR')}")
+    # Setting environment variables (runtime only, also seen by child processes)
+    temp_var = 'temporary_value'
+    os.environ['TEMP_VAR'] = temp_var
+    print(f"Temporary Variable: {temp_var}")  # No need to read it back
     
     # Using environment variables with defaults
-    database_url = os.getenv('DATABASE_URL', 'sqlite:///default.db')
-    api_timeout = int(os.getenv('API_TIMEOUT', '30'))
-    max_connections = int(os.getenv('MAX_CONNECTIONS', '10'))
+    database_url = os.environ.get('DATABASE_URL', 'sqlite:///default.db')
+    api_timeout = env_int('API_TIMEOUT', '30')
+    max_connections = env_int('MAX_CONNECTIONS', '10')
     
     print(f"\n🔗 Configuration with defaults:")
     print(f"Database URL: {database_url}")
@@ -85,49 +128,93 @@ def basic_env_examples():
     print(f"Max Connections: {max_connections}")
 
 
+class Config:
+    """Configuration class using environment variables"""
+    
+    # App name, environment and debug mode come from the shared CONFIG (see config.py).
+    # The other settings are read the first time they're used and then remembered,
+    # so settings that are never used are never parsed.
+    
+    _TEMPLATE = (
+        "Current Configuration:\n"
+        "  📱 App: {config.app_name} v{config.app_version}\n"
+        "  🌍 Environment: {config.environment}\n"
+        "  🐛 Debug Mode: {config.debug}\n"
+        "  🗄️  Database: {config.database_url}\n"
+        "  🔑 API Key: {api_key_status}\n"
+        "  📧 Email Host: {config.email_host}:{config.email_port}"
+    )
+    
+    # App settings (shared with main.py)
+    @property
+    def app_name(self):
+        return CONFIG.app_name
+    
+    @property
+    def debug(self):
+        return CONFIG.debug
+    
+    @property
+    def environment(self):
+        return CONFIG.python_env
+    
+    @cached_property
+    def app_version(self):
+        return os.getenv('APP_VERSION', '1.0.0')
+    
+    # Database settings (examples)
+    @cached_property
+    def database_url(self):
+        return os.getenv('DATABASE_URL', 'sqlite:///app.db')
+    
+    # API settings (examples)
+    @cached_property
+    def api_key(self):
+        return os.getenv('API_KEY', '')
+    
+    @cached_property
+    def secret_key(self):
+        return os.getenv('SECRET_KEY', 'dev-secret-key')
+    
+    # External services (examples)
+    @cached_property
+    def redis_url(self):
+        return os.getenv('REDIS_URL', 'redis://localhost:6379')
+    
+    @cached_property
+    def email_host(self):
+        return os.getenv('EMAIL_HOST', 'localhost')
+    
+    @cached_property
+    def email_port(self):
+        return env_int('EMAIL_PORT', '587')
+    
+    def is_development(self):
+        return self.environment == 'development'
+    
+    def is_production(self):
+        return self.environment == 'production'
+    
+    def display_config(self):
+        # One template, filled in with a single format() call
+        print(self._TEMPLATE.format(
+            config=self,
+            api_key_status='Set' if self.api_key else 'Not set',
+        ))
+
+
+@lru_cache(maxsize=1)
+def get_config():
+    """Return the app configuration, reading the environment only once"""
+    return Config()
+
+
 def configuration_examples():
     """Examples of using environment variables for configuration"""
     print("\n⚙️ Configuration Management:")
     
-    class Config:
-        """Configuration class using environment variables"""
-        
-        def __init__(self):
-            # App settings
-            self.app_name = os.getenv('APP_NAME', 'PythonApp')
-            self.app_version = os.getenv('APP_VERSION', '1.0.0')
-            self.debug = os.getenv('DEBUG', 'false').lower() == 'true'
-            self.environment = os.getenv('PYTHON_ENV', 'development')
-            
-            # Database settings (examples)
-            self.database_url = os.getenv('DATABASE_URL', 'sqlite:///app.db')
-            
-            # API settings (examples)
-            self.api_key = os.getenv('API_KEY', '')
-            self.secret_key = os.getenv('SECRET_KEY', 'dev-secret-key')
-            
-            # External services (examples)
-            self.redis_url = os.getenv('REDIS_URL', 'redis://localhost:6379')
-            self.email_host = os.getenv('EMAIL_HOST', 'localhost')
-            self.email_port = int(os.getenv('EMAIL_PORT', '587'))
-        
-        def is_development(self):
-            return self.environment == 'development'
-        
-        def is_production(self):
-            return self.environment == 'production'
-        
-        def display_config(self):
-            print("Current Configuration:")
-            print(f"  📱 App: {self.app_name} v{self.app_version}")
-            print(f"  🌍 Environment: {self.environment}")
-            print(f"  🐛 Debug Mode: {self.debug}")
-            print(f"  🗄️  Database: {self.database_url}")
-            print(f"  🔑 API Key: {'Set' if self.api_key else 'Not set'}")
-            print(f"  📧 Email Host: {self.email_host}:{self.email_port}")
-    
-    # Create and use configuration
-    config = Config()
+    # Get (and reuse) the configuration
+    config = get_config()
     config.display_config()
     
     # Environment-specific behavior
@@ -160,32 +247,34 @@ def security_examples():
     print("\n🛡️ Security checks:")
     
     # Check if sensitive variables are set
-    sensitive_vars = ['SECRET_KEY', 'API_KEY', 'DATABASE_URL']
-    for var in sensitive_vars:
-        value = os.getenv(var)
+    env = os.environ
+    lines = []
+    for var in _SENSITIVE_VARS:
+        value = env.get(var)
         if value:
             # Don't print actual values, just status
-            is_default = value in ['dev-secret-key', 'your-secret-key-here', 'sqlite:///app.db']
+            is_default = value in _DEFAULT_VALUES
             if is_default:
-                print(f"  ⚠️  {var}: Using default/template value")
+                lines.append(f"  ⚠️  {var}: Using default/template value")
             else:
-                print(f"  ✅ {var}: Custom value set")
+                lines.append(f"  ✅ {var}: Custom value set")
         else:
-            print(f"  ❌ {var}: Not set")
+            lines.append(f"  ❌ {var}: Not set")
+    print("\n".join(lines))
     
     # Validation examples
     def validate_environment():
         issues = []
+        env = os.environ
+        secret = env.get('SECRET_KEY', '')
         
         # Check for required variables in production
-        if os.getenv('PYTHON_ENV') == 'production':
-            required_vars = ['SECRET_KEY', 'DATABASE_URL']
-            for var in required_vars:
-                if not os.getenv(var):
+        if CONFIG.python_env == 'production':
+            for var in _REQUIRED_PROD_VARS:
+                if not env.get(var):
                     issues.append(f"Missing required variable: {var}")
         
         # Check for weak secrets
-        secret = os.getenv('SECRET_KEY', '')
         if secret and len(secret) < 32:
             issues.append("SECRET_KEY should be at least 32 characters long")
         
@@ -205,27 +294,17 @@ def practical_examples():
     print("\n🎯 Practical Examples:")
     
     # Feature flags
-    feature_enabled = os.getenv('FEATURE_NEW_UI', 'false').lower() == 'true'
+    feature_enabled = env_bool('FEATURE_NEW_UI')
     if feature_enabled:
         print("🆕 New UI feature is enabled")
     else:
         print("📱 Using classic UI")
     
     # Different behavior based on environment
-    env = os.getenv('PYTHON_ENV', 'development')
-    
-    if env == 'development':
-        log_level = 'DEBUG'
-        cache_timeout = 0  # No caching in dev
-    elif env == 'staging':
-        log_level = 'INFO'
-        cache_timeout = 300  # 5 minutes
-    elif env == 'production':
-        log_level = 'WARNING'
-        cache_timeout = 3600  # 1 hour
-    else:
-        log_level = 'INFO'
-        cache_timeout = 60  # 1 minute
+    env = CONFIG.python_env
+    
+    # Look up (log_level, cache_timeout) for this environment, with a fallback
+    log_level, cache_timeout = _ENV_SETTINGS.get(env, ('INFO', 60))  # Default: 1 minute
     
     print(f"\n📊 Environment-specific settings ({env}):")
     print(f"  📝 Log Level: {log_level}")
@@ -234,10 +313,11 @@ def practical_examples():
     # URL construction
     host = os.getenv('HOST', 'localhost')
     port = os.getenv('PORT', '8000')
-    ssl = os.getenv('USE_SSL', 'false').lower() == 'true'
+    ssl = env_bool('USE_SSL')
     
     protocol = 'https' if ssl else 'http'
-    base_url = f"{protocol}://{host}:{port}"
+    # join() works out the final length first and builds the string in one go
+    base_url = ''.join((protocol, '://', host, ':', port))
     
     print(f"\n🌐 Server configuration:")
     print(f"  Base URL: {base_url}")
@@ -15,12 +15,18 @@ New features:
 """
 
 import os
-try:
-    from dotenv import load_dotenv
-    load_dotenv()  # Load environment variables from .env file
-except ImportError:
-    # dotenv not installed yet, that's okay
-    pass
+import sys
+from functools import lru_cache
+
+# Loads the .env file and reads the shared settings (see config.py)
+from config import CONFIG, ENV_FILE
+
+
+@lru_cache(maxsize=1)
+def _env_file_exists(path=ENV_FILE):
+    """Check once whether the .env file exists and remember the answer"""
+    return os.path.exists(path)
+
 
 def main():
     """
@@ -50,7 +56,8 @@ def main():
 
 def practice_variables():
     """Practice working with variables"""
-    print("\n📝 Variables Practice:")
+    # Collect the output lines and write them all at once at the end
+    out = ["\n📝 Variables Practice:"]
     
     # Different types of variables
     name = "Python Learner"
@@ -58,65 +65,65 @@ def practice_variables():
     height = 5.9
     is_learning = True
     
-    print(f"Name: {name}")
-    print(f"Age: {age}")
-    print(f"Height: {height} feet")
-    print(f"Currently learning: {is_learning}")
+    out.append(f"Name: {name}")
+    out.append(f"Age: {age}")
+    out.append(f"Height: {height} feet")
+    out.append(f"Currently learning: {is_learning}")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def practice_basic_operations():
     """Practice basic mathematical operations"""
-    print("\n🧮 Basic Operations Practice:")
+    out = ["\n🧮 Basic Operations Practice:"]
     
     a = 10
     b = 3
     
-    print(f"{a} + {b} = {a + b}")
-    print(f"{a} - {b} = {a - b}")
-    print(f"{a} * {b} = {a * b}")
-    print(f"{a} / {b} = {a / b:.2f}")
-    print(f"{a} ** {b} = {a ** b}")
+    out.append(f"{a} + {b} = {a + b}")
+    out.append(f"{a} - {b} = {a - b}")
+    out.append(f"{a} * {b} = {a * b}")
+    out.append(f"{a} / {b} = {a / b:.2f}")
+    out.append(f"{a} ** {b} = {a ** b}")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def show_environment_info():
     """Show environment configuration and available features"""
-    print("\n🌍 Environment Information:")
-    
-    # Get environment variables with defaults
-    app_name = os.getenv('APP_NAME', 'PythonDockerApp')
-    python_env = os.getenv('PYTHON_ENV', 'development')
-    debug = os.getenv('DEBUG', 'false').lower() == 'true'
+    out = ["\n🌍 Environment Information:"]
     
-    print(f"  📱 App Name: {app_name}")
-    print(f"  🌍 Environment: {python_env}")
-    print(f"  🐛 Debug Mode: {debug}")
+    # Settings were read from the environment once, in config.py
+    out.append(f"  📱 App Name: {CONFIG.app_name}")
+    out.append(f"  🌍 Environment: {CONFIG.python_env}")
+    out.append(f"  🐛 Debug Mode: {CONFIG.debug}")
     
     # Check if .env file exists
-    if os.path.exists('.env'):
-        print("  ✅ .env file found")
+    if _env_file_exists():
+        out.append("  ✅ .env file found")
     else:
-        print("  ⚠️  No .env file (create with: make env-setup)")
+        out.append("  ⚠️  No .env file (create with: make env-setup)")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def practice_data_types():
     """Practice different data types"""
-    print("\n📊 Data Types Practice:")
+    out = ["\n📊 Data Types Practice:"]
     
     # List
     fruits = ["apple", "banana", "orange"]
-    print(f"Fruits list: {fruits}")
+    out.append(f"Fruits list: {fruits}")
     
     # Dictionary
     person = {"name": "Alice", "age": 30, "city": "New York"}
-    print(f"Person info: {person}")
+    out.append(f"Person info: {person}")
     
     # Tuple
     coordinates = (10, 20)
-    print(f"Coordinates: {coordinates}")
+    out.append(f"Coordinates: {coordinates}")
     
     # Set
     unique_numbers = {1, 2, 3, 3, 4, 4, 5}
-    print(f"Unique numbers: {unique_numbers}")
+    out.append(f"Unique numbers: {unique_numbers}")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == "__main__":